@@ -1,7 +1,9 @@
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
+import ctypes
 import math
+import numpy as np
 
 # --------------------------
 # GLOBAL TRANSFORM STATES
@@ -48,35 +50,95 @@ colors = [
     [1, 1, 0]    # Yellow
 ]
 
+# ---------------------------------------
+# VERTEX BUFFER (r, g, b, x, y, z)
+# ---------------------------------------
+STRIDE = 6 * 4  # bytes per interleaved vertex
+
+tetra_vao = None
+tetra_count = 0
+
+def build_tetrahedron():
+    data = []
+    for i, face in enumerate(faces):
+        for vertex in face:
+            data.extend(colors[i])
+            data.extend(vertices[vertex])
+    return np.array(data, dtype=np.float32)
+
+def create_vao(data):
+    """Upload data to a VBO and record its C3F_V3F layout in a VAO."""
+    vao = glGenVertexArrays(1)
+    glBindVertexArray(vao)
+    vbo = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+    glInterleavedArrays(GL_C3F_V3F, STRIDE, ctypes.c_void_p(0))
+    glBindVertexArray(0)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    return vao
+
 # --------------------------
 # DRAW TETRAHEDRON
 # --------------------------
 def draw_tetrahedron():
-    glBegin(GL_TRIANGLES)
-    for i, face in enumerate(faces):
-        glColor3fv(colors[i])
-        for vertex in face:
-            glVertex3fv(vertices[vertex])
-    glEnd()
+    glBindVertexArray(tetra_vao)
+    glDrawArrays(GL_TRIANGLES, 0, tetra_count)
+    glBindVertexArray(0)
+
+# ---------------------------------------
+# MATRIX HELPERS
+# ---------------------------------------
+def translate(x, y, z):
+    m = np.identity(4, dtype=np.float32)
+    m[:3, 3] = (x, y, z)
+    return m
+
+def scale(s):
+    return np.diag([s, s, s, 1]).astype(np.float32)
+
+def rotate(deg, x, y, z):
+    """Rotation about an arbitrary axis, like glRotatef, via Rodrigues' formula."""
+    k = np.array([x, y, z], dtype=np.float64)
+    k /= np.linalg.norm(k)
+    K = np.array([[0, -k[2], k[1]],
+                  [k[2], 0, -k[0]],
+                  [-k[1], k[0], 0]])
+    t = math.radians(deg)
+    m = np.identity(4, dtype=np.float32)
+    m[:3, :3] = np.identity(3) + math.sin(t) * K + (1 - math.cos(t)) * (K @ K)
+    return m
+
+
+def compose_matrix(camera, obj):
+    """Camera and object transforms as one column-major modelview matrix."""
+    m = (translate(camera["pan_x"], camera["pan_y"], camera["zoom"])
+         @ rotate(camera["rot_x"], 1, 0, 0)
+         @ rotate(camera["rot_y"], 0, 1, 0)
+         @ translate(obj["tx"], obj["ty"], obj["tz"])
+         @ scale(obj["scale"])
+         @ rotate(obj["rot_x"], 1, 0, 0)
+         @ rotate(obj["rot_y"], 0, 1, 0)
+         @ rotate(obj["rot_z"], 0, 0, 1))
+    return np.ascontiguousarray(m.T)
+
+# Rebuilt by display() only after input changed the transform state
+modelview = None
+matrix_dirty = True
 
 # ---------------------------------------
 # RENDER LOOP
 # ---------------------------------------
 def display():
-    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-    glLoadIdentity()
+    global modelview, matrix_dirty
 
-    # CAMERA TRANSFORMS
-    glTranslatef(camera["pan_x"], camera["pan_y"], camera["zoom"])
-    glRotatef(camera["rot_x"], 1, 0, 0)
-    glRotatef(camera["rot_y"], 0, 1, 0)
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
-    # OBJECT TRANSFORMS
-    glTranslatef(obj["tx"], obj["ty"], obj["tz"])
-    glScalef(obj["scale"], obj["scale"], obj["scale"])
-    glRotatef(obj["rot_x"], 1, 0, 0)
-    glRotatef(obj["rot_y"], 0, 1, 0)
-    glRotatef(obj["rot_z"], 0, 0, 1)
+    # CAMERA + OBJECT TRANSFORMS
+    if matrix_dirty:
+        modelview = compose_matrix(camera, obj)
+        matrix_dirty = False
+    glLoadMatrixf(modelview)
 
     draw_tetrahedron()
 
@@ -85,9 +147,14 @@ def display():
 # ---------------------------------------
 # KEYBOARD INPUT
 # ---------------------------------------
+def scene_state():
+    """Snapshot of everything display() depends on."""
+    return tuple(camera.values()) + tuple(obj.values())
+
 def keyboard(key, x, y):
-    global obj, camera
+    global obj, camera, matrix_dirty
 
+    before = scene_state()
     key = key.decode("utf-8")
 
     # SCALE OBJECT
@@ -120,26 +187,43 @@ def keyboard(key, x, y):
     if key == 'a': camera["pan_x"] -= 0.1
     if key == 'd': camera["pan_x"] += 0.1
 
+    # Unbound keys change nothing, so skip the redraw
+    if scene_state() == before:
+        return
+    matrix_dirty = True
     glutPostRedisplay()
 
 # ---------------------------------------
 # ARROW KEYS → CAMERA ROTATION
 # ---------------------------------------
 def special_input(key, x, y):
+    global matrix_dirty
+
+    before = scene_state()
     if key == GLUT_KEY_UP: camera["rot_x"] += 3
     if key == GLUT_KEY_DOWN: camera["rot_x"] -= 3
     if key == GLUT_KEY_LEFT: camera["rot_y"] -= 3
     if key == GLUT_KEY_RIGHT: camera["rot_y"] += 3
 
+    if scene_state() == before:
+        return
+    matrix_dirty = True
     glutPostRedisplay()
 
 # ---------------------------------------
 # SETUP
 # ---------------------------------------
 def init():
+    global tetra_vao, tetra_count
+
     glEnable(GL_DEPTH_TEST)
     glClearColor(0.1, 0.1, 0.1, 1)
 
+    # Upload the tetrahedron once; display() only issues the draw
+    data = build_tetrahedron()
+    tetra_count = len(data) // 6
+    tetra_vao = create_vao(data)
+
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
     gluPerspective(60, 1, 0.1, 100)
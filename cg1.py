@@ -1,8 +1,10 @@
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 from OpenGL.GLU import *
+import ctypes
 import math
 import sys
+import numpy as np
 
 # --- Global State Variables ---
 state = {
@@ -15,63 +17,109 @@ state = {
 }
 
 
-def draw_hexagon_prism():
+STRIDE = 6 * 4  # bytes per interleaved vertex (r, g, b, x, y, z)
+
+prism_vao = None
+prism_count = 0
+
+
+def build_hexagon_prism():
     radius = 1.0
     height = 0.5
 
-    # Top and bottom faces
-    top_vertices = []
-    bottom_vertices = []
-
-    for i in range(6):
-        angle = math.radians(i * 60)
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
-        top_vertices.append((x, y, height / 2))
-        bottom_vertices.append((x, y, -height / 2))
-
-    # Draw top face
-    glColor3f(0, 1, 0)
-    glBegin(GL_POLYGON)
-    for v in top_vertices:
-        glVertex3f(*v)
-    glEnd()
-
-    # Draw bottom face
-    glColor3f(0, 0.6, 0)
-    glBegin(GL_POLYGON)
-    for v in bottom_vertices:
-        glVertex3f(*v)
-    glEnd()
-
-    # Draw side faces
-    glColor3f(0, 0.8, 0)
-    glBegin(GL_QUADS)
-    for i in range(6):
-        v1 = top_vertices[i]
-        v2 = top_vertices[(i + 1) % 6]
-        v3 = bottom_vertices[(i + 1) % 6]
-        v4 = bottom_vertices[i]
-
-        glVertex3f(*v1)
-        glVertex3f(*v2)
-        glVertex3f(*v3)
-        glVertex3f(*v4)
-    glEnd()
+    # Top and bottom rings of the six corners
+    angles = np.radians(np.arange(6) * 60)
+    ring = np.stack([radius * np.cos(angles), radius * np.sin(angles), np.zeros(6)], axis=1)
+    top = ring + (0, 0, height / 2)
+    bottom = ring - (0, 0, height / 2)
+
+    # Top and bottom faces as triangle fans around vertex 0
+    fan = np.array([[0, i, i + 1] for i in range(1, 5)])
+
+    # Side faces, two triangles per quad (v1, v2, v3) and (v1, v3, v4)
+    i = np.arange(6)
+    j = (i + 1) % 6
+    v1, v2, v3, v4 = top[i], top[j], bottom[j], bottom[i]
+    sides = np.stack([v1, v2, v3, v1, v3, v4], axis=1).reshape(-1, 3)
+
+    positions = np.concatenate([top[fan].reshape(-1, 3), bottom[fan].reshape(-1, 3), sides])
+    colors = np.repeat([(0, 1, 0), (0, 0.6, 0), (0, 0.8, 0)], [12, 12, 36], axis=0)
+    return np.hstack([colors, positions]).astype(np.float32).ravel()
+
+
+def create_vao(data):
+    """Upload data to a VBO and record its C3F_V3F layout in a VAO."""
+    vao = glGenVertexArrays(1)
+    glBindVertexArray(vao)
+    vbo = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+    glInterleavedArrays(GL_C3F_V3F, STRIDE, ctypes.c_void_p(0))
+    glBindVertexArray(0)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    return vao
+
+
+def draw_hexagon_prism():
+    glBindVertexArray(prism_vao)
+    glDrawArrays(GL_TRIANGLES, 0, prism_count)
+    glBindVertexArray(0)
+
+
+# --------------------------------------------------------
+# Matrix Helpers
+# --------------------------------------------------------
+def translate(x, y, z):
+    m = np.identity(4, dtype=np.float32)
+    m[:3, 3] = (x, y, z)
+    return m
+
+
+def scale(s):
+    return np.diag([s, s, s, 1]).astype(np.float32)
+
+
+def rotate(deg, x, y, z):
+    """Rotation about an arbitrary axis, like glRotatef, via Rodrigues' formula."""
+    k = np.array([x, y, z], dtype=np.float64)
+    k /= np.linalg.norm(k)
+    K = np.array([[0, -k[2], k[1]],
+                  [k[2], 0, -k[0]],
+                  [-k[1], k[0], 0]])
+    t = math.radians(deg)
+    m = np.identity(4, dtype=np.float32)
+    m[:3, :3] = np.identity(3) + math.sin(t) * K + (1 - math.cos(t)) * (K @ K)
+    return m
+
+
+
+def compose_matrix(state):
+    """Object transform as a column-major modelview matrix."""
+    m = (translate(state["x"], state["y"], state["z"])
+         @ scale(state["scale"])
+         @ rotate(state["angle_x"], 1, 0, 0)
+         @ rotate(state["angle_y"], 0, 1, 0))
+    return np.ascontiguousarray(m.T)
+
+
+# Rebuilt by display() only after input changed the state
+modelview = None
+matrix_dirty = True
 
 
 # --------------------------------------------------------
 # Display Function
 # --------------------------------------------------------
 def display():
+    global modelview, matrix_dirty
+
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-    glLoadIdentity()
 
     # Camera / Transform
-    glTranslatef(state["x"], state["y"], state["z"])
-    glScalef(state["scale"], state["scale"], state["scale"])
-    glRotatef(state["angle_x"], 1, 0, 0)
-    glRotatef(state["angle_y"], 0, 1, 0)
+    if matrix_dirty:
+        modelview = compose_matrix(state)
+        matrix_dirty = False
+    glLoadMatrixf(modelview)
 
     draw_hexagon_prism()
     glutSwapBuffers()
@@ -80,7 +128,15 @@ def display():
 # --------------------------------------------------------
 # Keyboard Controls
 # --------------------------------------------------------
+def scene_state():
+    """Snapshot of everything display() depends on."""
+    return tuple(state.values())
+
+
 def keyboard(key, x, y):
+    global matrix_dirty
+
+    before = scene_state()
     if key == b'w':
         state["scale"] += 0.1
     elif key == b's':
@@ -107,11 +163,18 @@ def keyboard(key, x, y):
     elif key == b'\x1b':
         sys.exit()
 
+    # Unbound keys (and R on an untouched prism) change nothing, so skip the redraw
+    if scene_state() == before:
+        return
+    matrix_dirty = True
     glutPostRedisplay()
 
 
 # Arrow keys move the object
 def special_keys(key, x, y):
+    global matrix_dirty
+
+    before = scene_state()
     if key == GLUT_KEY_UP:
         state["y"] += 0.1
     elif key == GLUT_KEY_DOWN:
@@ -121,6 +184,9 @@ def special_keys(key, x, y):
     elif key == GLUT_KEY_RIGHT:
         state["x"] += 0.1
 
+    if scene_state() == before:
+        return
+    matrix_dirty = True
     glutPostRedisplay()
 
 
@@ -128,9 +194,16 @@ def special_keys(key, x, y):
 # Window Setup
 # --------------------------------------------------------
 def init():
+    global prism_vao, prism_count
+
     glClearColor(0.1, 0.1, 0.1, 1)
     glEnable(GL_DEPTH_TEST)
 
+    # Upload the prism once; display() only issues the draw
+    data = build_hexagon_prism()
+    prism_count = len(data) // 6
+    prism_vao = create_vao(data)
+
     glMatrixMode(GL_PROJECTION)
     glLoadIdentity()
     gluPerspective(60, 1, 0.1, 100)
@@ -1,7 +1,9 @@
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 from OpenGL.GLU import *
+import ctypes
 import math
+import numpy as np
 
 # ---------------- GLOBAL STATE ----------------
 
@@ -18,97 +20,155 @@ obj_scale = 1.0
 # Shape: 0 = cone, 1 = cylinder
 shape_type = 0
 
+# Mesh detail
+slices = 40
+radius = 1.0
+height = 2.0
+
+# Per-slice trig and color tables, computed once at import
+ANGLES = np.linspace(0, 2 * np.pi, slices + 1)
+COS = np.cos(ANGLES).astype(np.float32)
+SIN = np.sin(ANGLES).astype(np.float32)
+COLORS = np.stack([np.abs(SIN), np.abs(COS), np.abs(np.sin(2 * ANGLES))], axis=1).astype(np.float32)
+
+# Vertex buffers, interleaved r, g, b, x, y, z (filled in init)
+STRIDE = 6 * 4
+cone_vao = None
+cone_count = 0
+cylinder_vao = None
+cylinder_ranges = []  # (mode, first, count) per part
+
+
+# ---------------- GEOMETRY ----------------
+
+def ring(z):
+    """Positions of the slices + 1 rim points at height z."""
+    return np.stack([radius * COS, radius * SIN, np.full(slices + 1, z, np.float32)], axis=1)
+
+
+def build_cone():
+    """Apex plus the rim as one triangle fan of slices + 2 vertices."""
+    data = np.empty((slices + 2, 6), dtype=np.float32)
+    data[0, 3:] = (0, 0, height)
+    data[1:, 3:] = ring(0)
+    # One flat color per slice, stored on its last (provoking) vertex
+    data[2:, :3] = np.stack([np.abs(SIN[:-1]), np.abs(COS[:-1]), np.abs(SIN[1:])], axis=1)
+    data[:2, :3] = data[2, :3]
+    return data
+
+
+def build_cylinder():
+    # Side
+    side = np.empty((slices + 1, 2, 6), dtype=np.float32)
+    side[:, 0, 3:] = ring(0)
+    side[:, 1, 3:] = ring(height)
+    side[:, :, :3] = COLORS[:, None, :]
+
+    # Top cap, then bottom cap
+    caps = []
+    for z, color in ((height, (1, 0.2, 0.2)), (0, (0.2, 0.2, 1))):
+        cap = np.empty((slices + 2, 6), dtype=np.float32)
+        cap[0, 3:] = (0, 0, z)
+        cap[1:, 3:] = ring(z)
+        cap[:, :3] = color
+        caps.append(cap)
+
+    side = side.reshape(-1, 6)
+    cap = slices + 2
+    ranges = [
+        (GL_QUAD_STRIP, 0, len(side)),
+        (GL_TRIANGLE_FAN, len(side), cap),
+        (GL_TRIANGLE_FAN, len(side) + cap, cap),
+    ]
+    return np.concatenate([side] + caps), ranges
+
+
+def create_vao(data):
+    """Upload data to a VBO and record its C3F_V3F layout in a VAO."""
+    vao = glGenVertexArrays(1)
+    glBindVertexArray(vao)
+    vbo = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+    glInterleavedArrays(GL_C3F_V3F, STRIDE, ctypes.c_void_p(0))
+    glBindVertexArray(0)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    return vao
+
 
 # ---------------- DRAWING ----------------
 
 def draw_cone():
-    glPushMatrix()
-    glTranslatef(*obj_pos)
-    glRotatef(obj_rot[0], 1, 0, 0)
-    glRotatef(obj_rot[1], 0, 1, 0)
-    glRotatef(obj_rot[2], 0, 0, 1)
-    glScalef(obj_scale, obj_scale, obj_scale)
+    glShadeModel(GL_FLAT)
+    glBindVertexArray(cone_vao)
+    glDrawArrays(GL_TRIANGLE_FAN, 0, cone_count)
+    glBindVertexArray(0)
+    glShadeModel(GL_SMOOTH)
 
-    slices = 40
-    radius = 1.0
-    height = 2.0
 
-    glBegin(GL_TRIANGLES)
-    for i in range(slices):
-        angle1 = 2 * math.pi * i / slices
-        angle2 = 2 * math.pi * (i + 1) / slices
+def draw_cylinder():
+    glBindVertexArray(cylinder_vao)
+    for mode, first, count in cylinder_ranges:
+        glDrawArrays(mode, first, count)
+    glBindVertexArray(0)
 
-        x1, y1 = radius * math.cos(angle1), radius * math.sin(angle1)
-        x2, y2 = radius * math.cos(angle2), radius * math.sin(angle2)
 
-        glColor3f(abs(math.sin(angle1)), abs(math.cos(angle1)), abs(math.sin(angle2)))
+# ---------------- MATRICES ----------------
 
-        glVertex3f(0, 0, height)
-        glVertex3f(x1, y1, 0)
-        glVertex3f(x2, y2, 0)
-    glEnd()
+def translate(x, y, z):
+    m = np.identity(4, dtype=np.float32)
+    m[:3, 3] = (x, y, z)
+    return m
 
-    glPopMatrix()
 
+def scale(s):
+    return np.diag([s, s, s, 1]).astype(np.float32)
 
-def draw_cylinder():
-    glPushMatrix()
-    glTranslatef(*obj_pos)
-    glRotatef(obj_rot[0], 1, 0, 0)
-    glRotatef(obj_rot[1], 0, 1, 0)
-    glRotatef(obj_rot[2], 0, 0, 1)
-    glScalef(obj_scale, obj_scale, obj_scale)
 
-    slices = 40
-    radius = 1.0
-    height = 2.0
+def rotate(deg, x, y, z):
+    """Rotation about an arbitrary axis, like glRotatef, via Rodrigues' formula."""
+    k = np.array([x, y, z], dtype=np.float64)
+    k /= np.linalg.norm(k)
+    K = np.array([[0, -k[2], k[1]],
+                  [k[2], 0, -k[0]],
+                  [-k[1], k[0], 0]])
+    t = math.radians(deg)
+    m = np.identity(4, dtype=np.float32)
+    m[:3, :3] = np.identity(3) + math.sin(t) * K + (1 - math.cos(t)) * (K @ K)
+    return m
+
+
+
+def compose_matrix():
+    """Camera and object transforms as one column-major modelview matrix."""
+    m = (rotate(camera_rot[0], 1, 0, 0)
+         @ rotate(camera_rot[1], 0, 1, 0)
+         @ translate(-camera_pos[0], -camera_pos[1], -camera_pos[2])
+         @ translate(*obj_pos)
+         @ rotate(obj_rot[0], 1, 0, 0)
+         @ rotate(obj_rot[1], 0, 1, 0)
+         @ rotate(obj_rot[2], 0, 0, 1)
+         @ scale(obj_scale))
+    return np.ascontiguousarray(m.T)
 
-    # Side
-    glBegin(GL_QUAD_STRIP)
-    for i in range(slices + 1):
-        angle = 2 * math.pi * i / slices
-        x = radius * math.cos(angle)
-        y = radius * math.sin(angle)
-
-        glColor3f(abs(math.sin(angle)), abs(math.cos(angle)), abs(math.sin(angle * 2)))
-
-        glVertex3f(x, y, 0)
-        glVertex3f(x, y, height)
-    glEnd()
-
-    # Top cap
-    glBegin(GL_TRIANGLE_FAN)
-    glColor3f(1, 0.2, 0.2)
-    glVertex3f(0, 0, height)
-    for i in range(slices + 1):
-        angle = 2 * math.pi * i / slices
-        glVertex3f(radius * math.cos(angle), radius * math.sin(angle), height)
-    glEnd()
-
-    # Bottom cap
-    glBegin(GL_TRIANGLE_FAN)
-    glColor3f(0.2, 0.2, 1)
-    glVertex3f(0, 0, 0)
-    for i in range(slices + 1):
-        angle = 2 * math.pi * i / slices
-        glVertex3f(radius * math.cos(angle), radius * math.sin(angle), 0)
-    glEnd()
-
-    glPopMatrix()
+
+# Rebuilt by display() only after input changed the transform state
+modelview = None
+matrix_dirty = True
 
 
 # ---------------- SCENE ----------------
 
 def display():
-    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-    glLoadIdentity()
+    global modelview, matrix_dirty
 
-    # Camera rotation
-    glRotatef(camera_rot[0], 1, 0, 0)
-    glRotatef(camera_rot[1], 0, 1, 0)
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
-    # Camera translation
-    glTranslatef(-camera_pos[0], -camera_pos[1], -camera_pos[2])
+    # Camera + object transform
+    if matrix_dirty:
+        modelview = compose_matrix()
+        matrix_dirty = False
+    glLoadMatrixf(modelview)
 
     # Draw selected shape
     if shape_type == 0:
@@ -133,9 +193,15 @@ def reshape(w, h):
 
 # ---------------- CONTROLS ----------------
 
+def scene_state():
+    """Snapshot of everything display() depends on."""
+    return (shape_type, obj_scale, *camera_pos, *camera_rot, *obj_pos, *obj_rot)
+
+
 def keyboard(key, x, y):
-    global shape_type, camera_pos, obj_rot, obj_pos, obj_scale, camera_fov
+    global shape_type, camera_pos, obj_rot, obj_pos, obj_scale, camera_fov, matrix_dirty
 
+    before = scene_state()
     key = key.decode("utf-8")
 
     # ---------- Shape Toggle ----------
@@ -201,13 +267,18 @@ def keyboard(key, x, y):
         obj_rot[:] = [0, 0, 0]
         obj_scale = 1.0
 
+    # Unbound keys change nothing, so skip the redraw
+    if scene_state() == before:
+        return
+    matrix_dirty = True
     glutPostRedisplay()
 
 
 def special_keys(key, x, y):
-    global camera_rot
+    global camera_rot, matrix_dirty
 
     # Arrow keys rotate camera
+    before = scene_state()
     rot_speed = 3
 
     if key == GLUT_KEY_UP:
@@ -219,13 +290,26 @@ def special_keys(key, x, y):
     if key == GLUT_KEY_RIGHT:
         camera_rot[1] -= rot_speed
 
+    if scene_state() == before:
+        return
+    matrix_dirty = True
     glutPostRedisplay()
 
 
 def init():
+    global cone_vao, cone_count, cylinder_vao, cylinder_ranges
+
     glEnable(GL_DEPTH_TEST)
     glClearColor(0.1, 0.1, 0.1, 1)
 
+    # Upload both shapes once; the draw functions only bind and draw
+    data = build_cone()
+    cone_count = len(data)
+    cone_vao = create_vao(data)
+
+    data, cylinder_ranges = build_cylinder()
+    cylinder_vao = create_vao(data)
+
 
 # ---------------- MAIN ----------------
 
@@ -16,14 +16,18 @@ Controls:
 """
 
 import math
-import random
 import sys
 import os
 import ctypes
+import numpy as np
 import pygame
 from pygame.locals import *
+import OpenGL
+# Skip PyOpenGL's glGetError round trip after every call (must precede the GL import)
+OpenGL.ERROR_CHECKING = False
+OpenGL.ERROR_LOGGING = False
 from OpenGL.GL import *
-from OpenGL.GLU import *
+from OpenGL.GL import shaders
 
 # Try importing sound
 try:
@@ -31,66 +35,294 @@ try:
 except ImportError:
     SoundGenerator = None
 
+# Planar dimensions and physics tuning live with the kernels
+from physics import (TABLE_W, TABLE_L, HALF_GOAL, PUCK_RADIUS, MALLET_RADIUS,
+                     MIN_DIST_SQ, X, Z, VX, VZ, puck_step, mallet_step_player,
+                     ai_target, mallet_step_ai, resolve_collision, particle_step)
+
 # Table dimensions
-TABLE_W = 5.0   # Half Width (X) - total width is 10
-TABLE_L = 8.0   # Half Length (Z) - total length is 16
 TABLE_H = 0.0   # Table surface height (Y)
 WALL_H = 0.5    # Wall Height
 WALL_THICK = 0.3
 
-GOAL_W = 3.0    # Goal Opening Width (full width)
+WALL_Y = TABLE_H + WALL_H/2  # Rail center height
+WALL_HALF_T = WALL_THICK/2
+WALL_SIDE_W = TABLE_W - HALF_GOAL  # End rail length on each side of a goal
+GOAL_LINE_Z = TABLE_L + PUCK_RADIUS  # Puck center past this |z| is a goal
 
 # Physics
-FRICTION = 0.995
-RESTITUTION_WALL = 0.85
-RESTITUTION_PUCK = 0.95
+PHYS_DT = 1 / 120  # Fixed physics timestep
+MAX_SUBSTEPS = 5   # Steps per frame before falling behind real time
+
+# Frame pacing
+MAX_FPS = 60
+IDLE_FPS = 30  # Once the game is won nothing moves, so redraw less often
 
 # Dimensions
-PUCK_RADIUS = 0.35
 PUCK_HEIGHT = 0.12
-
-MALLET_RADIUS = 0.5
 MALLET_HEIGHT = 0.4
 
+# Particles
+PARTICLE_RADIUS = 0.08
+MAX_PARTICLES = 512
+PARTICLE_STRIDE = 7 * 4  # x, y, z, r, g, b, a as float32
+
+# Particle point sprites: sized like the fixed-function distance attenuation,
+# round with a soft edge, alpha fading with life (carried in the color)
+PARTICLE_VERTEX_SHADER = """
+#version 120
+uniform float point_scale;  // Diameter in pixels at distance 1
+void main() {
+    vec4 eye = gl_ModelViewMatrix * gl_Vertex;
+    gl_Position = gl_ProjectionMatrix * eye;
+    gl_PointSize = point_scale / length(eye.xyz);
+    gl_FrontColor = gl_Color;
+}
+"""
+
+PARTICLE_FRAGMENT_SHADER = """
+#version 120
+void main() {
+    vec2 p = gl_PointCoord * 2.0 - 1.0;
+    float r2 = dot(p, p);
+    if (r2 > 1.0)
+        discard;
+    gl_FragColor = vec4(gl_Color.rgb, gl_Color.a * smoothstep(1.0, 0.7, r2));
+}
+"""
+
 # Game Rules
 WIN_SCORE = 7
 
+# UI text
+SCORE_SEP = "  -  "
+HINT_TEXT = "WASD: Move | R: Reset | ESC: Quit"
+
+rng = np.random.default_rng()  # Shared by particle spawns and puck serves
+
 # ============================================================================
 # HELPER CLASSES
 # ============================================================================
 
-class Particle:
-    def __init__(self, x, y, z, color):
-        self.x, self.y, self.z = x, y, z
-        self.vx = random.uniform(-5, 5)
-        self.vy = random.uniform(2, 8)
-        self.vz = random.uniform(-5, 5)
-        self.life = 1.0
-        self.color = color
+def _state_property(i):
+    """Attribute view of one slot of an entity's physics state array"""
+    return property(lambda self: self.state[i],
+                    lambda self, value: self.state.__setitem__(i, value))
+
+def _interp_xz(entity, alpha):
+    """Entity position blended from its previous physics step by alpha"""
+    x0, z0 = entity.prev
+    return x0 + (entity.x - x0) * alpha, z0 + (entity.z - z0) * alpha
+
+class ParticlePool:
+    """Fixed-size particle storage as parallel numpy arrays.
+    
+    Live particles are kept packed in the first n rows.
+    """
+    def __init__(self, size=MAX_PARTICLES):
+        self.pos = np.zeros((size, 3), dtype=np.float32)
+        self.vel = np.zeros((size, 3), dtype=np.float32)
+        self.color = np.zeros((size, 3), dtype=np.float32)
+        self.life = np.zeros(size, dtype=np.float32)
+        self.n = 0
+        
+    def spawn(self, x, y, z, n, color):
+        i0 = self.n
+        n = min(n, len(self.life) - i0)  # Pool exhausted, drop the rest
+        vel = self.vel[i0:i0 + n]
+        vel[:, 0] = rng.uniform(-5, 5, n)
+        vel[:, 1] = rng.uniform(2, 8, n)
+        vel[:, 2] = rng.uniform(-5, 5, n)
+        self.pos[i0:i0 + n] = (x, y, z)
+        self.color[i0:i0 + n] = color
+        self.life[i0:i0 + n] = 1.0
+        self.n = i0 + n
         
     def update(self, dt):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.z += self.vz * dt
-        self.vy -= 20.0 * dt # Gravity for particles
-        self.life -= dt
-        
-    def draw(self, quadric):
-        if self.life <= 0: return
-        glDisable(GL_LIGHTING)
-        glPushMatrix()
-        glTranslatef(self.x, self.y, self.z)
-        glColor4f(*self.color, self.life)
-        gluSphere(quadric, 0.08, 4, 4)
-        glPopMatrix()
-        glEnable(GL_LIGHTING)
+        self.n = particle_step(self.pos, self.vel, self.color, self.life, self.n, dt)
+
+class Mesh:
+    """Static vertex buffer built from x, y, z, nx, ny, nz rows"""
+    STRIDE = 6 * 4
+    
+    def __init__(self, vertices, mode=GL_TRIANGLES):
+        # Stored normal first, the GL_N3F_V3F interleaved layout
+        data = np.ascontiguousarray(np.asarray(vertices, dtype=np.float32)[:, [3, 4, 5, 0, 1, 2]])
+        self.mode = mode
+        self.count = len(data)
+        self.vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, GL_STATIC_DRAW)
+        
+        # Record the vertex layout once; draw() only binds the VAO
+        self.vao = glGenVertexArrays(1)
+        glBindVertexArray(self.vao)
+        glInterleavedArrays(GL_N3F_V3F, self.STRIDE, ctypes.c_void_p(0))
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+    def draw(self):
+        glBindVertexArray(self.vao)
+        glDrawArrays(self.mode, 0, self.count)
+        glBindVertexArray(0)
+
+class TextAtlas:
+    """Fixed UI strings pre-rendered into one texture and drawn as one quad batch.
+    
+    entries is a list of (text, font, color); strings are looked up by text.
+    """
+    PAD = 1  # Blank rows between entries
+    
+    def __init__(self, entries):
+        surfs = [(text, font.render(text, True, color)) for text, font, color in entries]
+        width = max(surf.get_width() for _, surf in surfs)
+        height = sum(surf.get_height() + self.PAD for _, surf in surfs)
+        
+        # Stack the strings top to bottom and remember their texture rects
+        sheet = pygame.Surface((width, height), SRCALPHA)
+        self.rects = {}
+        y = 0
+        for text, surf in surfs:
+            w, h = surf.get_size()
+            sheet.blit(surf, (0, y))
+            # Uploaded bottom-up, so v runs from the bottom of the sheet
+            self.rects[text] = (w / width, 1 - (y + h) / height, 1 - y / height, w, h)
+            y += h + self.PAD
+        
+        data = pygame.image.tostring(sheet, 'RGBA', True)
+        self.tex = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.tex)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, data)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        
+        self.batch = []  # x, y, u, v rows of the queued quads
+        
+    def width(self, *texts):
+        return sum(self.rects[t][3] for t in texts)
+        
+    def add(self, text, x, y):
+        """Queue a string with its bottom-left corner at (x, y), returns its width"""
+        u1, v0, v1, w, h = self.rects[text]
+        self.batch += [(x, y, 0, v0), (x + w, y, u1, v0),
+                       (x + w, y - h, u1, v1), (x, y - h, 0, v1)]
+        return w
+        
+    def flush(self):
+        """Draw every queued string with a single draw call"""
+        if not self.batch:
+            return
+        quads = np.array(self.batch, dtype=np.float32)
+        self.batch = []
+        
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.tex)
+        glColor4f(1, 1, 1, 1)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        base = quads.ctypes.data  # Interleaved, so point both arrays into the one buffer
+        glVertexPointer(2, GL_FLOAT, 16, ctypes.c_void_p(base))
+        glTexCoordPointer(2, GL_FLOAT, 16, ctypes.c_void_p(base + 8))
+        glDrawArrays(GL_QUADS, 0, len(quads))
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        glDisable(GL_TEXTURE_2D)
+
+def cylinder_vertices(radius, height, slices, y=0.0, bottom=True):
+    """Triangles for an upright cylinder standing at height y, with caps"""
+    # Same vertex placement as gluCylinder/gluDisk after a -90 degree X rotation
+    a = np.linspace(0, 2 * math.pi, slices + 1)
+    normals = np.stack([np.sin(a), np.zeros_like(a), -np.cos(a)], axis=1)
+    low = normals * radius + (0, y, 0)
+    high = low + (0, height, 0)
+    
+    # Side: two triangles per slice, with smooth outward normals
+    pos = np.stack([low[:-1], low[1:], high[1:], low[:-1], high[1:], high[:-1]], axis=1)
+    nrm = np.stack([normals[:-1], normals[1:], normals[1:], normals[:-1], normals[1:], normals[:-1]], axis=1)
+    parts = [np.concatenate([pos, nrm], axis=2).reshape(-1, 6)]
+    
+    # Caps: triangle fans around the axis
+    caps = [(high, height, (0, 1, 0))]
+    if bottom:
+        caps.append((low[::-1], 0.0, (0, -1, 0)))
+    for rim, dy, normal in caps:
+        cap = np.empty((slices, 3, 6), dtype=np.float32)
+        cap[:, 0, :3] = (0, y + dy, 0)
+        cap[:, 1, :3] = rim[:-1]
+        cap[:, 2, :3] = rim[1:]
+        cap[:, :, 3:] = normal
+        parts.append(cap.reshape(-1, 6))
+    return np.concatenate(parts)
+
+def circle_vertices(radius, segments, y=0.0):
+    """Line loop for a flat circle at height y, normals pointing up"""
+    th = np.linspace(0, 2 * math.pi, segments, endpoint=False)
+    data = np.zeros((segments, 6), dtype=np.float32)
+    data[:, 0] = radius * np.cos(th)
+    data[:, 1] = y
+    data[:, 2] = radius * np.sin(th)
+    data[:, 4] = 1
+    return data
+
+def box_vertices():
+    """Unit cube centered at the origin as GL_QUADS, one normal per face"""
+    a, b = -0.5, 0.5
+    faces = [
+        ((0, 1, 0), [(a, b, a), (b, b, a), (b, b, b), (a, b, b)]),   # Top
+        ((0, -1, 0), [(a, a, b), (b, a, b), (b, a, a), (a, a, a)]),  # Bottom
+        ((0, 0, 1), [(a, a, b), (b, a, b), (b, b, b), (a, b, b)]),   # Front
+        ((0, 0, -1), [(b, a, a), (a, a, a), (a, b, a), (b, b, a)]),  # Back
+        ((1, 0, 0), [(b, a, b), (b, a, a), (b, b, a), (b, b, b)]),   # Right
+        ((-1, 0, 0), [(a, a, a), (a, a, b), (a, b, b), (a, b, a)]),  # Left
+    ]
+    return np.array([v + n for n, quad in faces for v in quad], dtype=np.float32)
+
+def look_at(eye, target, up):
+    """Column-major view matrix equivalent to gluLookAt"""
+    eye = np.asarray(eye, dtype=np.float64)
+    f = np.asarray(target, dtype=np.float64) - eye
+    f /= np.linalg.norm(f)
+    s = np.cross(f, up)
+    s /= np.linalg.norm(s)
+    u = np.cross(s, f)
+    
+    m = np.identity(4)
+    m[0, :3], m[1, :3], m[2, :3] = s, u, -f
+    m[:3, 3] = -m[:3, :3] @ eye
+    return np.ascontiguousarray(m.T, dtype=np.float32)
+
+def perspective(fovy, aspect, near, far):
+    """Column-major projection matrix equivalent to gluPerspective"""
+    f = 1 / math.tan(math.radians(fovy) / 2)
+    m = np.zeros((4, 4))
+    m[0, 0] = f / aspect
+    m[1, 1] = f
+    m[2, 2] = (far + near) / (near - far)
+    m[2, 3] = 2 * far * near / (near - far)
+    m[3, 2] = -1
+    return np.ascontiguousarray(m.T, dtype=np.float32)
+
+def ortho(left, right, bottom, top, near, far):
+    """Column-major projection matrix equivalent to glOrtho"""
+    m = np.identity(4)
+    m[0, 0] = 2 / (right - left)
+    m[1, 1] = 2 / (top - bottom)
+    m[2, 2] = -2 / (far - near)
+    m[:3, 3] = (-(right + left) / (right - left), -(top + bottom) / (top - bottom),
+                -(far + near) / (far - near))
+    return np.ascontiguousarray(m.T, dtype=np.float32)
 
 # ============================================================================
 # GAME ENTITIES
 # ============================================================================
 
 class Puck:
+    x, z, vx, vz = (_state_property(i) for i in (X, Z, VX, VZ))
+    
     def __init__(self):
+        self.state = np.zeros(4)  # x, z, vx, vz, stepped by the physics kernels
         self.reset()
         
     def reset(self):
@@ -100,80 +332,39 @@ class Puck:
         self.vx = 0.0
         self.vz = 0.0
         # Random initial velocity
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(3, 6)
+        angle = rng.uniform(0, 2 * math.pi)
+        speed = rng.uniform(3, 6)
         self.vx = math.cos(angle) * speed
         self.vz = math.sin(angle) * speed
+        self.prev = self.state[:2].copy()  # Position before the last physics step
             
     def update(self, dt):
-        # Move
-        self.x += self.vx * dt
-        self.z += self.vz * dt
-        
-        # Friction
-        self.vx *= FRICTION
-        self.vz *= FRICTION
-        
-        # Wall Collisions (X - Side Walls)
-        limit_x = TABLE_W - PUCK_RADIUS
-        if self.x > limit_x:
-            self.x = limit_x
-            self.vx *= -RESTITUTION_WALL
-            return 'wall'
-        elif self.x < -limit_x:
-            self.x = -limit_x
-            self.vx *= -RESTITUTION_WALL
-            return 'wall'
-
-        # End Walls (Z) - Check if NOT in goal area
-        limit_z = TABLE_L - PUCK_RADIUS
-        
-        # If puck is outside goal width, bounce off end wall
-        if abs(self.x) > GOAL_W/2:
-            if self.z > limit_z:
-                self.z = limit_z
-                self.vz *= -RESTITUTION_WALL
-                return 'wall'
-            elif self.z < -limit_z:
-                self.z = -limit_z
-                self.vz *= -RESTITUTION_WALL
-                return 'wall'
-                
-        return None
-
-    def draw(self, quadric):
+        return 'wall' if puck_step(self.state, dt) else None
+
+    def draw(self, mesh, alpha=1.0):
+        x, z = _interp_xz(self, alpha)
         glPushMatrix()
-        glTranslatef(self.x, self.y, self.z)
+        glTranslatef(x, self.y, z)
         
         # Puck body (Red)
         glColor3f(0.9, 0.1, 0.1)
-        
-        # Draw as cylinder laying flat
-        glPushMatrix()
-        glRotatef(-90, 1, 0, 0)  # Rotate so cylinder is horizontal
-        gluCylinder(quadric, PUCK_RADIUS, PUCK_RADIUS, PUCK_HEIGHT, 20, 1)
-        # Bottom cap
-        gluDisk(quadric, 0, PUCK_RADIUS, 20, 1)
-        # Top cap
-        glTranslatef(0, 0, PUCK_HEIGHT)
-        gluDisk(quadric, 0, PUCK_RADIUS, 20, 1)
-        glPopMatrix()
+        mesh.draw()
         
         glPopMatrix()
 
 class Mallet:
+    x, z, vx, vz = (_state_property(i) for i in (X, Z, VX, VZ))
+    
     def __init__(self, is_player, z_start, color):
         self.is_player = is_player
+        self.state = np.zeros(4)  # x, z, vx, vz, stepped by the physics kernels
         self.x = 0
         self.y = TABLE_H + MALLET_HEIGHT/2
         self.z = z_start
+        self.prev = self.state[:2].copy()  # Position before the last physics step
         self.color = color
         
         # Physics
-        self.vx = 0
-        self.vz = 0
-        self.last_x = 0
-        self.last_z = z_start
         self.speed = 15.0
         
         # Bounds (each player stays on their half)
@@ -182,90 +373,33 @@ class Mallet:
         else: # Bottom player (Negative Z) - Human
             self.min_z, self.max_z = -TABLE_L + MALLET_RADIUS + 0.5, -0.5
 
-    def update(self, dt, target_pos=None):
-        self.last_x, self.last_z = self.x, self.z
-        
+    def update(self, dt, input_vec=None, target_pos=None):
         if self.is_player:
-            # Keyboard Control
-            keys = pygame.key.get_pressed()
-            dx = 0
-            dz = 0
-            if keys[K_a] or keys[K_LEFT]: dx += 1
-            if keys[K_d] or keys[K_RIGHT]: dx -= 1
-            if keys[K_w] or keys[K_UP]: dz += 1    # W moves forward (positive Z from player view)
-            if keys[K_s] or keys[K_DOWN]: dz -= 1  # S moves backward
+            # Keyboard Control, as a (dx, dz) direction read once per frame
+            dx, dz = input_vec if input_vec else (0, 0)
+            mallet_step_player(self.state, dx, dz, self.speed, dt, self.min_z, self.max_z)
             
-            # Normalize diagonal movement
-            if dx != 0 or dz != 0:
-                mag = math.sqrt(dx*dx + dz*dz)
-                dx /= mag
-                dz /= mag
-                
-            self.x += dx * self.speed * dt
-            self.z += dz * self.speed * dt
+        elif target_pos:
+            # AI Logic - decides where to go for the puck at target_pos, then moves
+            aim_x, aim_z, rate = ai_target(*target_pos)
+            mallet_step_ai(self.state, aim_x, aim_z, rate, dt, self.min_z, self.max_z)
             
         else:
-            # AI Logic - Improved to avoid getting stuck
-            if target_pos:
-                tx, tz = target_pos
-                
-                # If puck is near side walls, AI should position to push it away from wall
-                puck_near_left_wall = tx < -TABLE_W + 1.5
-                puck_near_right_wall = tx > TABLE_W - 1.5
-                
-                # Aim slightly behind the puck (toward AI's goal) to push it forward
-                target_z_offset = -0.8  # Stay behind puck to hit it forward
-                
-                # If puck is stuck near edge, push it toward center
-                if puck_near_left_wall:
-                    # Position to the left of puck to push it right
-                    tx = tx - 0.5
-                elif puck_near_right_wall:
-                    # Position to the right of puck to push it left
-                    tx = tx + 0.5
-                
-                diff_x = tx - self.x
-                diff_z = (tz + target_z_offset) - self.z
-                
-                # Faster AI movement when chasing, slower when defending
-                ai_speed = 8.0 if tz > 2 else 5.0
-                self.x += diff_x * ai_speed * dt
-                self.z += diff_z * ai_speed * dt
-        
-        # Clamp to bounds
-        limit_x = TABLE_W - MALLET_RADIUS - 0.2
-        self.x = max(-limit_x, min(limit_x, self.x))
-        self.z = max(self.min_z, min(self.max_z, self.z))
-        
-        # Calculate Velocity (for collision impulse)
-        if dt > 0:
-            self.vx = (self.x - self.last_x) / dt
-            self.vz = (self.z - self.last_z) / dt
-
-    def draw(self, quadric):
+            # No target: hold position
+            mallet_step_player(self.state, 0, 0, self.speed, dt, self.min_z, self.max_z)
+
+    def draw(self, base_mesh, handle_mesh, alpha=1.0):
+        x, z = _interp_xz(self, alpha)
         glPushMatrix()
-        glTranslatef(self.x, self.y, self.z)
-        
-        glColor3f(*self.color)
+        glTranslatef(x, self.y, z)
         
         # Base cylinder
-        glPushMatrix()
-        glRotatef(-90, 1, 0, 0)
-        gluCylinder(quadric, MALLET_RADIUS, MALLET_RADIUS, MALLET_HEIGHT * 0.6, 20, 1)
-        gluDisk(quadric, 0, MALLET_RADIUS, 20, 1)
-        glTranslatef(0, 0, MALLET_HEIGHT * 0.6)
-        gluDisk(quadric, 0, MALLET_RADIUS, 20, 1)
-        glPopMatrix()
+        glColor3f(*self.color)
+        base_mesh.draw()
         
         # Handle (smaller cylinder on top)
-        glPushMatrix()
-        glTranslatef(0, MALLET_HEIGHT * 0.6, 0)
-        glRotatef(-90, 1, 0, 0)
         glColor3f(0.3, 0.3, 0.3)  # Dark handle
-        gluCylinder(quadric, 0.15, 0.15, MALLET_HEIGHT * 0.5, 12, 1)
-        glTranslatef(0, 0, MALLET_HEIGHT * 0.5)
-        gluDisk(quadric, 0, 0.15, 12, 1)
-        glPopMatrix()
+        handle_mesh.draw()
         
         glPopMatrix()
 
@@ -276,6 +410,10 @@ class Game:
         pygame.init()
         pygame.display.set_mode((w, h), DOUBLEBUF | OPENGL | RESIZABLE)
         pygame.display.set_caption("3D Air Hockey")
+        # run() ignores these, so have SDL drop them at the source (held keys are
+        # read from the keyboard state, which is kept up to date without KEYUP events)
+        pygame.event.set_blocked([MOUSEMOTION, MOUSEBUTTONDOWN, MOUSEBUTTONUP, MOUSEWHEEL,
+                                  KEYUP, TEXTINPUT, TEXTEDITING])
         self.width, self.height = w, h
         
         self.init_gl()
@@ -285,7 +423,42 @@ class Game:
         if SoundGenerator:
             self.sound = SoundGenerator()
             
-        self.quadric = gluNewQuadric()
+        # Puck and mallet geometry is built once, positioned per frame
+        self.puck_mesh = Mesh(cylinder_vertices(PUCK_RADIUS, PUCK_HEIGHT, 20))
+        self.mallet_mesh = Mesh(cylinder_vertices(MALLET_RADIUS, MALLET_HEIGHT * 0.6, 20))
+        self.handle_mesh = Mesh(cylinder_vertices(0.15, MALLET_HEIGHT * 0.5, 12,
+                                                  y=MALLET_HEIGHT * 0.6, bottom=False))
+        self.box_mesh = Mesh(box_vertices(), GL_QUADS)
+        self.center_circle = Mesh(circle_vertices(1.5, 36, y=TABLE_H + 0.01), GL_LINE_LOOP)
+        
+        # Camera: Behind player 1, looking at the center of the table
+        self.view_matrix = look_at((0, 12, -18), (0, 0, 0), (0, 1, 0))
+        
+        # Table geometry never changes, so record it once and replay it
+        # (lit surfaces and unlit markings separately, for the render passes)
+        self.table_dl = glGenLists(2)
+        self.markings_dl = self.table_dl + 1
+        glNewList(self.table_dl, GL_COMPILE)
+        self.draw_table()
+        glEndList()
+        glNewList(self.markings_dl, GL_COMPILE)
+        self.draw_markings()
+        glEndList()
+        
+        # Particle vertex buffer, refilled every frame with the live particles
+        self.particle_data = np.zeros((MAX_PARTICLES, 7), dtype=np.float32)
+        self.particle_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.particle_vbo)
+        glBufferData(GL_ARRAY_BUFFER, self.particle_data.nbytes, None, GL_DYNAMIC_DRAW)
+        self.particle_vao = glGenVertexArrays(1)
+        glBindVertexArray(self.particle_vao)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, PARTICLE_STRIDE, ctypes.c_void_p(0))
+        glColorPointer(4, GL_FLOAT, PARTICLE_STRIDE, ctypes.c_void_p(12))
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.init_particle_shader()
         
         self.start_game()
         
@@ -297,6 +470,18 @@ class Game:
         self.font = pygame.font.SysFont('Arial', 48, bold=True)
         self.font_small = pygame.font.SysFont('Arial', 24)
         
+        # Every UI string, including score digits, lives in one texture atlas
+        white, small = (255, 255, 255), self.font_small
+        self.atlas = TextAtlas(
+            [(str(d), self.font, white) for d in range(10)] +
+            [(SCORE_SEP, self.font, white),
+             ("YOU WIN!", self.font, (50, 255, 100)),
+             ("AI WIN!", self.font, (50, 255, 100)),
+             ("YOU", small, (100, 150, 255)),
+             ("AI", small, (255, 100, 100)),
+             (HINT_TEXT, small, (150, 150, 150)),
+             ("Press R to restart", small, (200, 200, 200))])
+        
     def init_gl(self):
         glEnable(GL_DEPTH_TEST)
         glEnable(GL_LIGHTING)
@@ -317,95 +502,105 @@ class Game:
         
         glClearColor(0.1, 0.1, 0.15, 1.0)
         
+        # Particles are round points whose size falls off with distance
+        glEnable(GL_POINT_SMOOTH)
+        glPointParameterfv(GL_POINT_DISTANCE_ATTENUATION, (0, 0, 1))
+        
         self.resize(self.width, self.height)
         
     def resize(self, w, h):
         self.width, self.height = w, h
         glViewport(0, 0, w, h)
+        # Scene and UI projections only change here, so build both once
+        self.projection = perspective(45, w/h, 0.1, 200)
+        self.ui_projection = ortho(0, w, h, 0, -1, 1)
         glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45, w/h, 0.1, 200)
+        glLoadMatrixf(self.projection)
         glMatrixMode(GL_MODELVIEW)
         
+        # Point size (in pixels at distance 1) matching a particle sphere
+        self.point_size = 2 * PARTICLE_RADIUS * h / (2 * math.tan(math.radians(45) / 2))
+        glPointSize(self.point_size)
+        
+    def init_particle_shader(self):
+        """Compile the particle sprite shader; keeps fixed-function points if GLSL fails"""
+        try:
+            self.particle_shader = shaders.compileProgram(
+                shaders.compileShader(PARTICLE_VERTEX_SHADER, GL_VERTEX_SHADER),
+                shaders.compileShader(PARTICLE_FRAGMENT_SHADER, GL_FRAGMENT_SHADER))
+        except Exception as e:
+            print(f"Particle shader unavailable, using fixed-function points: {e}")
+            self.particle_shader = None
+            return
+        
+        self.point_scale_loc = glGetUniformLocation(self.particle_shader, "point_scale")
+        # Only particles are drawn as points, so sprite state can stay on
+        glEnable(GL_VERTEX_PROGRAM_POINT_SIZE)
+        glEnable(GL_POINT_SPRITE)
+        
     def start_game(self):
         self.p1 = Mallet(True, -5.0, (0.2, 0.4, 0.9))   # Blue (Human at bottom)
         self.p2 = Mallet(False, 5.0, (0.9, 0.3, 0.2))   # Red (AI at top)
         self.puck = Puck()
         self.scores = [0, 0]  # [Player1, Player2]
-        self.particles = []
+        self.particles = ParticlePool()
         self.winner = None
+        self.accum = 0.0  # Unsimulated time carried between frames
         
     def check_collision(self, m, p):
-        # Circle-Circle Collision in XZ plane
+        # Cheap rejection before calling into the collision kernel
         dx = p.x - m.x
         dz = p.z - m.z
-        dist_sq = dx*dx + dz*dz
-        min_dist = PUCK_RADIUS + MALLET_RADIUS
+        if dx*dx + dz*dz >= MIN_DIST_SQ:
+            return
         
-        if dist_sq < min_dist * min_dist and dist_sq > 0:
-            dist = math.sqrt(dist_sq)
-            
-            # Normalize direction
-            nx = dx / dist
-            nz = dz / dist
-            
-            # Push puck out of mallet
-            overlap = min_dist - dist
-            p.x += nx * overlap
-            p.z += nz * overlap
+        if resolve_collision(p.state, m.state):
+            # Sound
+            if self.sound: 
+                self.sound.play('mallet_hit')
             
-            # Relative velocity
-            rvx = p.vx - m.vx
-            rvz = p.vz - m.vz
-            
-            # Velocity along collision normal
-            vel_along_normal = rvx * nx + rvz * nz
-            
-            # Only resolve if approaching
-            if vel_along_normal < 0:
-                # Impulse
-                j = -(1 + RESTITUTION_PUCK) * vel_along_normal
-                
-                p.vx += j * nx
-                p.vz += j * nz
-                
-                # Add mallet velocity influence
-                p.vx += m.vx * 0.6
-                p.vz += m.vz * 0.6
-                
-                # Cap speed
-                speed = math.sqrt(p.vx*p.vx + p.vz*p.vz)
-                max_speed = 25.0
-                if speed > max_speed:
-                    p.vx = (p.vx / speed) * max_speed
-                    p.vz = (p.vz / speed) * max_speed
-                
-                # Sound
-                if self.sound: 
-                    self.sound.play('mallet_hit')
-                
-                # Particles
-                self.spawn_particles(p.x, p.y + 0.2, p.z, 8, (1, 1, 0.3))
+            # Particles
+            self.spawn_particles(p.x, p.y + 0.2, p.z, 8, (1, 1, 0.3))
             
     def spawn_particles(self, x, y, z, n, col):
-        for _ in range(n):
-            self.particles.append(Particle(x, y, z, col))
+        self.particles.spawn(x, y, z, n, col)
             
     def update(self):
-        dt = self.clock.tick(60) / 1000.0
+        dt = self.clock.tick(IDLE_FPS if self.winner else MAX_FPS) / 1000.0
         if dt > 0.1: dt = 0.1  # Cap delta time
         
         if self.winner: 
             return
         
-        # AI targeting logic
-        if self.puck.z > 0:  # Puck in AI's half
-            ai_target = (self.puck.x, self.puck.z)
-        else:  # Puck in player's half, AI defends
-            ai_target = (0, 5)
+        # Keyboard state is sampled once per frame and shared by every step
+        # (W moves forward, toward positive Z from the player's view)
+        keys = pygame.key.get_pressed()
+        dx = (keys[K_a] or keys[K_LEFT]) - (keys[K_d] or keys[K_RIGHT])
+        dz = (keys[K_w] or keys[K_UP]) - (keys[K_s] or keys[K_DOWN])
+        
+        # Advance physics in fixed steps, independent of the frame rate
+        self.accum += dt
+        steps = 0
+        step_physics, input_vec = self.step_physics, (dx, dz)
+        while self.accum >= PHYS_DT and steps < MAX_SUBSTEPS and not self.winner:
+            step_physics(PHYS_DT, input_vec)
+            self.accum -= PHYS_DT
+            steps += 1
+        # On a stall, drop the backlog instead of trying to catch up later
+        if steps == MAX_SUBSTEPS:
+            self.accum = min(self.accum, PHYS_DT)
+            
+        # Update particles
+        if self.particles.n:
+            self.particles.update(dt)
+        
+    def step_physics(self, dt, input_vec):
+        # Remember where everything was, for render interpolation
+        for e in (self.p1, self.p2, self.puck):
+            e.prev[:] = e.state[:2]
         
-        self.p1.update(dt)
-        self.p2.update(dt, ai_target)
+        self.p1.update(dt, input_vec)
+        self.p2.update(dt, target_pos=(self.puck.x, self.puck.z))
         
         res = self.puck.update(dt)
         if res == 'wall' and self.sound: 
@@ -416,15 +611,11 @@ class Game:
         self.check_collision(self.p2, self.puck)
         
         # Goal Checks
-        if self.puck.z > TABLE_L + PUCK_RADIUS:
+        z = self.puck.z
+        if z > GOAL_LINE_Z:
             self.goal(0)  # Player 1 scores (puck went past AI)
-        elif self.puck.z < -TABLE_L - PUCK_RADIUS:
+        elif z < -GOAL_LINE_Z:
             self.goal(1)  # Player 2 (AI) scores
-            
-        # Update particles
-        self.particles = [p for p in self.particles if p.life > 0]
-        for p in self.particles: 
-            p.update(dt)
         
     def goal(self, scorer_idx):
         self.scores[scorer_idx] += 1
@@ -456,48 +647,48 @@ class Game:
         glColor3f(0.4, 0.25, 0.1)
         
         # Left wall
-        self.draw_box(-TABLE_W - WALL_THICK/2, TABLE_H + WALL_H/2, 0, 
+        self.draw_box(-TABLE_W - WALL_HALF_T, WALL_Y, 0, 
                       WALL_THICK, WALL_H, TABLE_L * 2)
         # Right wall
-        self.draw_box(TABLE_W + WALL_THICK/2, TABLE_H + WALL_H/2, 0, 
+        self.draw_box(TABLE_W + WALL_HALF_T, WALL_Y, 0, 
                       WALL_THICK, WALL_H, TABLE_L * 2)
         
         # Top wall (with goal opening)
-        wall_side_w = (TABLE_W - GOAL_W/2)
         # Left part of top wall
-        self.draw_box(-TABLE_W + wall_side_w/2, TABLE_H + WALL_H/2, TABLE_L + WALL_THICK/2,
-                      wall_side_w, WALL_H, WALL_THICK)
+        self.draw_box(-TABLE_W + WALL_SIDE_W/2, WALL_Y, TABLE_L + WALL_HALF_T,
+                      WALL_SIDE_W, WALL_H, WALL_THICK)
         # Right part of top wall
-        self.draw_box(TABLE_W - wall_side_w/2, TABLE_H + WALL_H/2, TABLE_L + WALL_THICK/2,
-                      wall_side_w, WALL_H, WALL_THICK)
+        self.draw_box(TABLE_W - WALL_SIDE_W/2, WALL_Y, TABLE_L + WALL_HALF_T,
+                      WALL_SIDE_W, WALL_H, WALL_THICK)
         
         # Bottom wall (with goal opening)
-        self.draw_box(-TABLE_W + wall_side_w/2, TABLE_H + WALL_H/2, -TABLE_L - WALL_THICK/2,
-                      wall_side_w, WALL_H, WALL_THICK)
-        self.draw_box(TABLE_W - wall_side_w/2, TABLE_H + WALL_H/2, -TABLE_L - WALL_THICK/2,
-                      wall_side_w, WALL_H, WALL_THICK)
+        self.draw_box(-TABLE_W + WALL_SIDE_W/2, WALL_Y, -TABLE_L - WALL_HALF_T,
+                      WALL_SIDE_W, WALL_H, WALL_THICK)
+        self.draw_box(TABLE_W - WALL_SIDE_W/2, WALL_Y, -TABLE_L - WALL_HALF_T,
+                      WALL_SIDE_W, WALL_H, WALL_THICK)
         
         # Goal areas (darker)
         glColor3f(0.05, 0.05, 0.05)
         # Top goal
         glBegin(GL_QUADS)
         glNormal3f(0, 1, 0)
-        glVertex3f(-GOAL_W/2, TABLE_H - 0.01, TABLE_L)
-        glVertex3f(GOAL_W/2, TABLE_H - 0.01, TABLE_L)
-        glVertex3f(GOAL_W/2, TABLE_H - 0.01, TABLE_L + 1)
-        glVertex3f(-GOAL_W/2, TABLE_H - 0.01, TABLE_L + 1)
+        glVertex3f(-HALF_GOAL, TABLE_H - 0.01, TABLE_L)
+        glVertex3f(HALF_GOAL, TABLE_H - 0.01, TABLE_L)
+        glVertex3f(HALF_GOAL, TABLE_H - 0.01, TABLE_L + 1)
+        glVertex3f(-HALF_GOAL, TABLE_H - 0.01, TABLE_L + 1)
         glEnd()
         # Bottom goal
         glBegin(GL_QUADS)
         glNormal3f(0, 1, 0)
-        glVertex3f(-GOAL_W/2, TABLE_H - 0.01, -TABLE_L)
-        glVertex3f(GOAL_W/2, TABLE_H - 0.01, -TABLE_L)
-        glVertex3f(GOAL_W/2, TABLE_H - 0.01, -TABLE_L - 1)
-        glVertex3f(-GOAL_W/2, TABLE_H - 0.01, -TABLE_L - 1)
+        glVertex3f(-HALF_GOAL, TABLE_H - 0.01, -TABLE_L)
+        glVertex3f(HALF_GOAL, TABLE_H - 0.01, -TABLE_L)
+        glVertex3f(HALF_GOAL, TABLE_H - 0.01, -TABLE_L - 1)
+        glVertex3f(-HALF_GOAL, TABLE_H - 0.01, -TABLE_L - 1)
         glEnd()
         
+    def draw_markings(self):
+        """Unlit table markings; drawn with lighting already disabled"""
         # Center line
-        glDisable(GL_LIGHTING)
         glColor3f(1, 1, 1)
         glLineWidth(3)
         glBegin(GL_LINES)
@@ -506,159 +697,116 @@ class Game:
         glEnd()
         
         # Center circle
-        glPushMatrix()
-        glTranslatef(0, TABLE_H + 0.01, 0)
-        glRotatef(90, 1, 0, 0)
-        self.draw_circle_outline(1.5)
-        glPopMatrix()
+        self.center_circle.draw()
         
         # Goal lines
         glColor3f(1, 0, 0)
         glBegin(GL_LINES)
         # Top goal line
-        glVertex3f(-GOAL_W/2, TABLE_H + 0.01, TABLE_L)
-        glVertex3f(GOAL_W/2, TABLE_H + 0.01, TABLE_L)
+        glVertex3f(-HALF_GOAL, TABLE_H + 0.01, TABLE_L)
+        glVertex3f(HALF_GOAL, TABLE_H + 0.01, TABLE_L)
         # Bottom goal line
-        glVertex3f(-GOAL_W/2, TABLE_H + 0.01, -TABLE_L)
-        glVertex3f(GOAL_W/2, TABLE_H + 0.01, -TABLE_L)
+        glVertex3f(-HALF_GOAL, TABLE_H + 0.01, -TABLE_L)
+        glVertex3f(HALF_GOAL, TABLE_H + 0.01, -TABLE_L)
         glEnd()
         
-        glEnable(GL_LIGHTING)
-        
     def draw_box(self, cx, cy, cz, w, h, d):
         """Draw a box centered at (cx, cy, cz) with dimensions w, h, d"""
-        x1, x2 = cx - w/2, cx + w/2
-        y1, y2 = cy - h/2, cy + h/2
-        z1, z2 = cz - d/2, cz + d/2
-        
-        glBegin(GL_QUADS)
-        # Top
-        glNormal3f(0, 1, 0)
-        glVertex3f(x1, y2, z1); glVertex3f(x2, y2, z1)
-        glVertex3f(x2, y2, z2); glVertex3f(x1, y2, z2)
-        # Bottom
-        glNormal3f(0, -1, 0)
-        glVertex3f(x1, y1, z2); glVertex3f(x2, y1, z2)
-        glVertex3f(x2, y1, z1); glVertex3f(x1, y1, z1)
-        # Front
-        glNormal3f(0, 0, 1)
-        glVertex3f(x1, y1, z2); glVertex3f(x2, y1, z2)
-        glVertex3f(x2, y2, z2); glVertex3f(x1, y2, z2)
-        # Back
-        glNormal3f(0, 0, -1)
-        glVertex3f(x2, y1, z1); glVertex3f(x1, y1, z1)
-        glVertex3f(x1, y2, z1); glVertex3f(x2, y2, z1)
-        # Right
-        glNormal3f(1, 0, 0)
-        glVertex3f(x2, y1, z2); glVertex3f(x2, y1, z1)
-        glVertex3f(x2, y2, z1); glVertex3f(x2, y2, z2)
-        # Left
-        glNormal3f(-1, 0, 0)
-        glVertex3f(x1, y1, z1); glVertex3f(x1, y1, z2)
-        glVertex3f(x1, y2, z2); glVertex3f(x1, y2, z1)
-        glEnd()
+        glPushMatrix()
+        glTranslatef(cx, cy, cz)
+        glScalef(w, h, d)
+        self.box_mesh.draw()
+        glPopMatrix()
         
-    def draw_circle_outline(self, r):
-        glBegin(GL_LINE_LOOP)
-        for i in range(36):
-            th = 2 * math.pi * i / 36
-            glVertex2f(r * math.cos(th), r * math.sin(th))
-        glEnd()
-
     def render(self):
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
-        
-        # Camera: Behind player 1, looking at the table
-        # Using gluLookAt for proper camera setup
-        eye_x, eye_y, eye_z = 0, 12, -18  # Camera position (behind player)
-        look_x, look_y, look_z = 0, 0, 0   # Look at center of table
-        up_x, up_y, up_z = 0, 1, 0         # Up vector
         
-        gluLookAt(eye_x, eye_y, eye_z,
-                  look_x, look_y, look_z,
-                  up_x, up_y, up_z)
+        # Camera (fixed, so the view matrix is built once in __init__)
+        glLoadMatrixf(self.view_matrix)
         
-        # Draw scene
-        self.draw_table()
-        self.p1.draw(self.quadric)
-        self.p2.draw(self.quadric)
-        self.puck.draw(self.quadric)
+        # Lit pass: table, mallets and puck
+        glCallList(self.table_dl)
+        # Entities are drawn between their last two physics steps
+        alpha = self.accum / PHYS_DT
+        self.p1.draw(self.mallet_mesh, self.handle_mesh, alpha)
+        self.p2.draw(self.mallet_mesh, self.handle_mesh, alpha)
+        self.puck.draw(self.puck_mesh, alpha)
         
-        # Draw particles
+        # Unlit pass: table markings, then blended particles and UI overlay
+        glDisable(GL_LIGHTING)
+        glCallList(self.markings_dl)
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        for p in self.particles: 
-            p.draw(self.quadric)
+        if self.particles.n:
+            self.draw_particles()
+        self.draw_ui()
         glDisable(GL_BLEND)
+        glEnable(GL_LIGHTING)
         
-        # Draw UI overlay
-        self.draw_ui()
         pygame.display.flip()
 
+    def draw_particles(self):
+        """Draw every live particle with a single GL_POINTS call (pool must be non-empty,
+        lighting off)"""
+        pool = self.particles
+        n = pool.n
+        
+        # Pack live particles as x, y, z, r, g, b, a (alpha fades with life)
+        data = self.particle_data
+        data[:n, :3] = pool.pos[:n]
+        data[:n, 3:6] = pool.color[:n]
+        data[:n, 6] = pool.life[:n]
+        
+        glBindBuffer(GL_ARRAY_BUFFER, self.particle_vbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, n * PARTICLE_STRIDE, data[:n])
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        if self.particle_shader:
+            glUseProgram(self.particle_shader)
+            glUniform1f(self.point_scale_loc, self.point_size)
+        glBindVertexArray(self.particle_vao)
+        glDrawArrays(GL_POINTS, 0, n)
+        glBindVertexArray(0)
+        if self.particle_shader:
+            glUseProgram(0)
+
     def draw_ui(self):
-        # Switch to 2D rendering
+        """Score, labels and messages; expects lighting off and blending on"""
+        # Switch to 2D rendering (render reloads the view matrix every frame,
+        # so the modelview needs no save and restore)
         glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        glOrtho(0, self.width, self.height, 0, -1, 1)
+        glLoadMatrixf(self.ui_projection)
         glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
         glLoadIdentity()
-        glDisable(GL_LIGHTING)
         glDisable(GL_DEPTH_TEST)
         
-        # Score display
-        score_text = f"{self.scores[0]}  -  {self.scores[1]}"
-        surf = self.font.render(score_text, True, (255, 255, 255))
-        data = pygame.image.tostring(surf, 'RGBA', True)
-        w, h = surf.get_size()
+        atlas = self.atlas
+        cx = self.width//2
         
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glRasterPos2i(self.width//2 - w//2, 60)
-        glDrawPixels(w, h, GL_RGBA, GL_UNSIGNED_BYTE, data)
+        # Score display
+        a, b = str(self.scores[0]), str(self.scores[1])
+        x = cx - atlas.width(a, SCORE_SEP, b)//2
+        x += atlas.add(a, x, 60)
+        x += atlas.add(SCORE_SEP, x, 60)
+        atlas.add(b, x, 60)
         
         # Labels
-        p1_label = self.font_small.render("YOU", True, (100, 150, 255))
-        data1 = pygame.image.tostring(p1_label, 'RGBA', True)
-        w1, h1 = p1_label.get_size()
-        glRasterPos2i(self.width//2 - 80, 60)
-        glDrawPixels(w1, h1, GL_RGBA, GL_UNSIGNED_BYTE, data1)
-        
-        p2_label = self.font_small.render("AI", True, (255, 100, 100))
-        data2 = pygame.image.tostring(p2_label, 'RGBA', True)
-        w2, h2 = p2_label.get_size()
-        glRasterPos2i(self.width//2 + 60, 60)
-        glDrawPixels(w2, h2, GL_RGBA, GL_UNSIGNED_BYTE, data2)
+        atlas.add("YOU", cx - 80, 60)
+        atlas.add("AI", cx + 60, 60)
         
         # Controls hint
-        hint = self.font_small.render("WASD: Move | R: Reset | ESC: Quit", True, (150, 150, 150))
-        hint_data = pygame.image.tostring(hint, 'RGBA', True)
-        wh, hh = hint.get_size()
-        glRasterPos2i(self.width//2 - wh//2, self.height - 20)
-        glDrawPixels(wh, hh, GL_RGBA, GL_UNSIGNED_BYTE, hint_data)
+        atlas.add(HINT_TEXT, cx - atlas.width(HINT_TEXT)//2, self.height - 20)
         
         # Winner text
         if self.winner:
-            win_surf = self.font.render(self.winner, True, (50, 255, 100))
-            win_data = pygame.image.tostring(win_surf, 'RGBA', True)
-            ww, whi = win_surf.get_size()
-            glRasterPos2i(self.width//2 - ww//2, self.height//2)
-            glDrawPixels(ww, whi, GL_RGBA, GL_UNSIGNED_BYTE, win_data)
-            
-            restart_surf = self.font_small.render("Press R to restart", True, (200, 200, 200))
-            restart_data = pygame.image.tostring(restart_surf, 'RGBA', True)
-            rw, rh = restart_surf.get_size()
-            glRasterPos2i(self.width//2 - rw//2, self.height//2 + 50)
-            glDrawPixels(rw, rh, GL_RGBA, GL_UNSIGNED_BYTE, restart_data)
+            atlas.add(self.winner, cx - atlas.width(self.winner)//2, self.height//2)
+            restart = "Press R to restart"
+            atlas.add(restart, cx - atlas.width(restart)//2, self.height//2 + 50)
+        
+        atlas.flush()
 
-        glDisable(GL_BLEND)
         glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glPopMatrix()
         glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
+        glLoadMatrixf(self.projection)
         glMatrixMode(GL_MODELVIEW)
 
     def run(self):
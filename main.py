@@ -12,7 +12,11 @@ state = {
 }
 
 
-def draw_hexagon():
+# Display list holding the hexagon geometry (compiled in init)
+hexagon_list = None
+
+
+def build_hexagon():
     glBegin(GL_POLYGON)
     radius = 0.2
     for i in range(6):
@@ -24,6 +28,10 @@ def draw_hexagon():
     glEnd()
 
 
+def draw_hexagon():
+    glCallList(hexagon_list)
+
+
 def display():
     glClear(GL_COLOR_BUFFER_BIT)
     glLoadIdentity()
@@ -94,13 +102,25 @@ def special_keys(key, x, y):
     glutPostRedisplay()
 
 
+def init():
+    global hexagon_list
+
+    glClearColor(0.1, 0.1, 0.1, 1.0)  # Dark Grey Background
+
+    # The hexagon never changes shape, only its transform, so compile it once
+    hexagon_list = glGenLists(1)
+    glNewList(hexagon_list, GL_COMPILE)
+    build_hexagon()
+    glEndList()
+
+
 def main():
     glutInit()
     glutInitDisplayMode(GLUT_DOUBLE | GLUT_RGBA)
     glutInitWindowSize(600, 600)
     glutCreateWindow(b"Control the Hexagon")
 
-    glClearColor(0.1, 0.1, 0.1, 1.0)  # Dark Grey Background
+    init()
 
     # Register the Display Function
     glutDisplayFunc(display)
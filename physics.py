@@ -0,0 +1,246 @@
+"""
+Air hockey physics kernels
+==========================
+Planar (XZ) puck and mallet physics, plus the particle effect step, for game.py.
+
+Each entity keeps its state in a float64 array [x, z, vx, vz] that the
+kernels update in place. The kernels are compiled with Numba when it is
+installed (eagerly, from the signatures below, and cached on disk) and
+run as plain Python otherwise.
+"""
+
+import math
+
+import numpy as np
+
+# Numba is optional; without it the physics kernels run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
+# Table dimensions
+TABLE_W = 5.0   # Half Width (X) - total width is 10
+TABLE_L = 8.0   # Half Length (Z) - total length is 16
+
+GOAL_W = 3.0    # Goal Opening Width (full width)
+
+# Physics
+FRICTION = 0.995  # Velocity kept per 1/60 s
+RESTITUTION_WALL = 0.85
+RESTITUTION_PUCK = 0.95
+
+WALL_BOUNCE = -RESTITUTION_WALL      # Velocity factor off a wall
+PUCK_IMPULSE = 1 + RESTITUTION_PUCK  # Impulse factor off a mallet
+
+# Dimensions
+PUCK_RADIUS = 0.35
+MALLET_RADIUS = 0.5
+
+LIMIT_X = TABLE_W - PUCK_RADIUS  # Puck center limits against the walls
+LIMIT_Z = TABLE_L - PUCK_RADIUS
+HALF_GOAL = GOAL_W * 0.5
+
+MALLET_LIMIT_X = TABLE_W - MALLET_RADIUS - 0.2
+
+MIN_DIST = PUCK_RADIUS + MALLET_RADIUS  # Puck/mallet contact distance
+MIN_DIST_SQ = MIN_DIST * MIN_DIST
+
+INV_SQRT2 = 1 / math.sqrt(2)  # Diagonal input normalization
+
+MAX_PUCK_SPEED = 25.0
+MAX_PUCK_SPEED_SQ = MAX_PUCK_SPEED * MAX_PUCK_SPEED
+
+PARTICLE_GRAVITY = 20.0
+
+# State array layout
+X, Z, VX, VZ = 0, 1, 2, 3
+
+
+@njit("int64(float64[::1], float64)", cache=True, fastmath=True)
+def puck_step(puck, dt):
+    """Move the puck one step and bounce it off the walls.
+
+    Returns 1 if a wall was hit, else 0.
+    """
+    # Move
+    puck[X] += puck[VX] * dt
+    puck[Z] += puck[VZ] * dt
+
+    # Friction (scaled so any dt matches the 60 FPS tuning)
+    damp = FRICTION ** (dt * 60.0)
+    puck[VX] *= damp
+    puck[VZ] *= damp
+
+    # Wall Collisions (X - Side Walls)
+    if puck[X] > LIMIT_X:
+        puck[X] = LIMIT_X
+        puck[VX] *= WALL_BOUNCE
+        return 1
+    elif puck[X] < -LIMIT_X:
+        puck[X] = -LIMIT_X
+        puck[VX] *= WALL_BOUNCE
+        return 1
+
+    # End Walls (Z) - Check if NOT in goal area
+    # If puck is outside goal width, bounce off end wall
+    if abs(puck[X]) > HALF_GOAL:
+        if puck[Z] > LIMIT_Z:
+            puck[Z] = LIMIT_Z
+            puck[VZ] *= WALL_BOUNCE
+            return 1
+        elif puck[Z] < -LIMIT_Z:
+            puck[Z] = -LIMIT_Z
+            puck[VZ] *= WALL_BOUNCE
+            return 1
+
+    return 0
+
+
+@njit(cache=True, fastmath=True)
+def _mallet_finish(mallet, last_x, last_z, dt, min_z, max_z):
+    """Clamp a moved mallet to its half and derive its velocity."""
+    # Clamp to bounds
+    mallet[X] = max(-MALLET_LIMIT_X, min(MALLET_LIMIT_X, mallet[X]))
+    mallet[Z] = max(min_z, min(max_z, mallet[Z]))
+
+    # Calculate Velocity (for collision impulse)
+    if dt > 0:
+        mallet[VX] = (mallet[X] - last_x) / dt
+        mallet[VZ] = (mallet[Z] - last_z) / dt
+
+
+@njit("void(float64[::1], float64, float64, float64, float64, float64, float64)",
+      cache=True, fastmath=True)
+def mallet_step_player(mallet, dx, dz, speed, dt, min_z, max_z):
+    """Move a keyboard-driven mallet by the input direction (dx, dz)."""
+    last_x, last_z = mallet[X], mallet[Z]
+
+    # Normalize diagonal movement (both axes pressed)
+    step = speed * dt
+    if dx != 0 and dz != 0:
+        step *= INV_SQRT2
+
+    mallet[X] += dx * step
+    mallet[Z] += dz * step
+
+    _mallet_finish(mallet, last_x, last_z, dt, min_z, max_z)
+
+
+@njit("UniTuple(float64, 3)(float64, float64)", cache=True, fastmath=True)
+def ai_target(puck_x, puck_z):
+    """Decide where the AI mallet heads for the given puck position.
+
+    Returns (aim_x, aim_z, rate), rate being the approach speed per second.
+    """
+    # Chase the puck in the AI's half, otherwise fall back to defend
+    if puck_z > 0:
+        tx, tz = puck_x, puck_z
+    else:
+        tx, tz = 0.0, 5.0
+
+    # If puck is stuck near a side wall, position beside it to push it toward center
+    aim_x = tx - 0.5 * (tx < -TABLE_W + 1.5) + 0.5 * (tx > TABLE_W - 1.5)
+
+    # Aim slightly behind the puck (toward AI's goal) to push it forward
+    aim_z = tz - 0.8
+
+    # Faster AI movement when chasing, slower when defending
+    rate = 8.0 if tz > 2 else 5.0
+    return aim_x, aim_z, rate
+
+
+@njit("void(float64[::1], float64, float64, float64, float64, float64, float64)",
+      cache=True, fastmath=True)
+def mallet_step_ai(mallet, aim_x, aim_z, rate, dt, min_z, max_z):
+    """Move the AI mallet toward (aim_x, aim_z), closing rate * dt of the gap."""
+    last_x, last_z = mallet[X], mallet[Z]
+
+    step = rate * dt
+    mallet[X] += (aim_x - mallet[X]) * step
+    mallet[Z] += (aim_z - mallet[Z]) * step
+
+    _mallet_finish(mallet, last_x, last_z, dt, min_z, max_z)
+
+
+@njit("int64(float64[::1], float64[::1])", cache=True, fastmath=True)
+def resolve_collision(puck, mallet):
+    """Circle-circle mallet/puck collision in the XZ plane.
+
+    Updates the puck in place. Returns 1 if the mallet struck it, else 0.
+    """
+    dx = puck[X] - mallet[X]
+    dz = puck[Z] - mallet[Z]
+    dist_sq = dx*dx + dz*dz
+
+    if dist_sq < MIN_DIST_SQ and dist_sq > 0:
+        inv_dist = 1.0 / math.sqrt(dist_sq)
+
+        # Normalize direction
+        nx = dx * inv_dist
+        nz = dz * inv_dist
+
+        # Push puck out of mallet
+        overlap = MIN_DIST - dist_sq * inv_dist
+        puck[X] += nx * overlap
+        puck[Z] += nz * overlap
+
+        # Relative velocity
+        rvx = puck[VX] - mallet[VX]
+        rvz = puck[VZ] - mallet[VZ]
+
+        # Velocity along collision normal
+        vel_along_normal = rvx * nx + rvz * nz
+
+        # Only resolve if approaching
+        if vel_along_normal < 0:
+            # Impulse
+            j = -PUCK_IMPULSE * vel_along_normal
+
+            pvx = puck[VX] + j * nx
+            pvz = puck[VZ] + j * nz
+
+            # Add mallet velocity influence
+            pvx += mallet[VX] * 0.6
+            pvz += mallet[VZ] * 0.6
+
+            # Cap speed (the sqrt is only needed when capping)
+            speed_sq = pvx*pvx + pvz*pvz
+            if speed_sq > MAX_PUCK_SPEED_SQ:
+                scale = MAX_PUCK_SPEED / math.sqrt(speed_sq)
+                pvx *= scale
+                pvz *= scale
+
+            puck[VX] = pvx
+            puck[VZ] = pvz
+            return 1
+
+    return 0
+
+
+@njit("int64(float32[:, ::1], float32[:, ::1], float32[:, ::1], float32[::1], int64, float64)",
+      cache=True, fastmath=True)
+def particle_step(pos, vel, color, life, n, dt):
+    """Advance the first n particles and pack the survivors to the front.
+
+    Returns the new live count.
+    """
+    dt32 = np.float32(dt)
+    fall = np.float32(PARTICLE_GRAVITY * dt)
+
+    k = 0
+    for i in range(n):
+        t = life[i] - dt32
+        if t <= 0:
+            continue
+
+        for j in range(3):
+            pos[k, j] = pos[i, j] + vel[i, j] * dt32
+            vel[k, j] = vel[i, j]
+            color[k, j] = color[i, j]
+        vel[k, 1] -= fall
+        life[k] = t
+        k += 1
+
+    return k
@@ -1,6 +1,6 @@
 import math
-import struct
 import random
+import numpy as np
 import pygame
 
 class SoundGenerator:
@@ -18,31 +18,25 @@ class SoundGenerator:
         self.generate_sounds()
 
     def generate_wave(self, duration, freq_start, freq_end, decay=True, volume=0.5):
-        # Generate raw audio data
+        # Generate raw audio data, all samples at once
         sample_rate = 44100
         n_samples = int(sample_rate * duration)
-        buf = bytearray()
+        t = np.arange(n_samples) / sample_rate
         
-        for i in range(n_samples):
-            t = float(i) / sample_rate
-            # Frequency sweep
-            f = freq_start + (freq_end - freq_start) * (t / duration)
-            # Sine wave
-            val = math.sin(2 * math.pi * f * t)
-            
-            # Envelope (decay)
-            if decay:
-                env = 1.0 - (t / duration)
-                env = env ** 2  # quadratic decay
-                val *= env
-            
-            val *= volume * 32767
-            
-            # Angle for stereo (center)
-            frame = struct.pack('<hh', int(val), int(val))
-            buf.extend(frame)
-            
-        return pygame.mixer.Sound(buffer=buf)
+        # Frequency sweep
+        f = freq_start + (freq_end - freq_start) * (t / duration)
+        # Sine wave
+        val = np.sin(2 * math.pi * f * t)
+        
+        # Envelope (decay)
+        if decay:
+            val *= (1.0 - t / duration) ** 2  # quadratic decay
+        
+        val *= volume * 32767
+        
+        # Same 16-bit sample on both channels (center)
+        samples = np.repeat(val.astype('<i2'), 2)
+        return pygame.mixer.Sound(buffer=samples)
 
     def generate_sounds(self):
         if not self.enabled: return